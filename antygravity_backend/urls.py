@@ -5,7 +5,10 @@ URL configuration for antygravity_backend project.
 from django.contrib import admin
 from django.urls import path, include
 
+from core.views import healthz
+
 urlpatterns = [
+    path('healthz/', healthz, name='healthz'),
     path('admin/', admin.site.urls),
     path('api/', include('core.urls')),
 ]
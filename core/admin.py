@@ -2,8 +2,11 @@
 Django Admin Configuration for Core App.
 """
 
+import csv
+
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
+from django.http import StreamingHttpResponse
 
 from .models import (
     User,
@@ -18,6 +21,24 @@ from .models import (
 )
 
 
+class _Echo:
+    """File-like object that returns what is written, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+# Leading characters that make spreadsheet apps evaluate a cell as a formula
+_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+
+
+def _csv_cell(value):
+    """Quote a string cell that a spreadsheet would otherwise run as a formula."""
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     """Admin configuration for custom User model."""
@@ -40,12 +61,17 @@ class UserAdmin(BaseUserAdmin):
         }),
     )
 
+    def get_queryset(self, request):
+        # Columns the changelist never shows are deferred; the change form loads them on access
+        return super().get_queryset(request).defer('avatar_url')
+
 
 @admin.register(SocialAccount)
 class SocialAccountAdmin(admin.ModelAdmin):
     list_display = ['user', 'provider', 'provider_user_id', 'created_at']
     list_filter = ['provider']
     search_fields = ['user__email', 'provider_user_id']
+    list_select_related = ('user',)
 
 
 @admin.register(ChildProfile)
@@ -53,6 +79,7 @@ class ChildProfileAdmin(admin.ModelAdmin):
     list_display = ['name', 'user', 'age', 'created_at']
     list_filter = ['created_at']
     search_fields = ['name', 'user__email']
+    list_select_related = ('user',)
 
 
 @admin.register(ParentalRule)
@@ -60,6 +87,7 @@ class ParentalRuleAdmin(admin.ModelAdmin):
     list_display = ['rule_type', 'child', 'parent', 'is_active', 'created_at']
     list_filter = ['rule_type', 'is_active']
     search_fields = ['child__name', 'parent__email', 'app_package_name']
+    list_select_related = ('child__user', 'parent')
 
 
 @admin.register(RuleViolation)
@@ -67,6 +95,7 @@ class RuleViolationAdmin(admin.ModelAdmin):
     list_display = ['child', 'rule', 'occurred_at']
     list_filter = ['occurred_at']
     search_fields = ['child__name', 'description']
+    list_select_related = ('child__user', 'rule__child')
 
 
 @admin.register(NetworkDevice)
@@ -74,6 +103,29 @@ class NetworkDeviceAdmin(admin.ModelAdmin):
     list_display = ['name', 'ip_address', 'mac_address', 'device_type', 'is_trusted', 'is_blocked', 'owner']
     list_filter = ['device_type', 'is_trusted', 'is_blocked']
     search_fields = ['name', 'ip_address', 'mac_address', 'owner__email']
+    list_select_related = ('owner',)
+    actions = ['export_csv']
+
+    export_fields = ['name', 'ip_address', 'mac_address', 'device_type', 'is_trusted', 'is_blocked', 'first_seen_at', 'last_seen_at']
+
+    @admin.action(description='Export selected devices as CSV')
+    def export_csv(self, request, queryset):
+        writer = csv.writer(_Echo())
+        # Stream rows in chunks so large exports do not load the whole table
+        rows = queryset.select_related('owner').order_by('pk').iterator(chunk_size=2000)
+
+        def generate():
+            yield writer.writerow(['owner'] + self.export_fields)
+            for device in rows:
+                # Names and types come from client scans, so no cell is written raw
+                yield writer.writerow([
+                    _csv_cell(value)
+                    for value in [device.owner.email] + [getattr(device, f) for f in self.export_fields]
+                ])
+
+        response = StreamingHttpResponse(generate(), content_type='text/csv')
+        response['Content-Disposition'] = 'attachment; filename="network_devices.csv"'
+        return response
 
 
 @admin.register(NetworkScanLog)
@@ -81,6 +133,10 @@ class NetworkScanLogAdmin(admin.ModelAdmin):
     list_display = ['owner', 'network_ssid', 'created_at']
     list_filter = ['created_at']
     search_fields = ['owner__email', 'network_ssid']
+    list_select_related = ('owner',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('json_payload')
 
 
 @admin.register(AppPrivacyProfile)
@@ -89,9 +145,16 @@ class AppPrivacyProfileAdmin(admin.ModelAdmin):
     list_filter = ['category']
     search_fields = ['app_name', 'package_name']
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('permissions')
+
 
 @admin.register(PrivacyCheck)
 class PrivacyCheckAdmin(admin.ModelAdmin):
     list_display = ['app_name', 'user', 'calculated_privacy_score', 'suggested_action', 'created_at']
     list_filter = ['suggested_action', 'network_usage_level', 'created_at']
     search_fields = ['app_name', 'app_package_name', 'user__email']
+    list_select_related = ('user',)
+
+    def get_queryset(self, request):
+        return super().get_queryset(request).defer('permissions')
@@ -3,6 +3,7 @@ Custom User Manager for email-based authentication.
 """
 
 from django.contrib.auth.models import BaseUserManager
+from django.db import models
 
 
 class UserManager(BaseUserManager):
@@ -30,3 +31,14 @@ class UserManager(BaseUserManager):
             raise ValueError('Superuser must have is_superuser=True.')
 
         return self.create_user(email, password, **extra_fields)
+
+
+class SelectRelatedManager(models.Manager):
+    """Manager that always joins the given relations, for UI listings."""
+
+    def __init__(self, *related_fields):
+        super().__init__()
+        self.related_fields = related_fields
+
+    def get_queryset(self):
+        return super().get_queryset().select_related(*self.related_fields)
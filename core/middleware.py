@@ -0,0 +1,25 @@
+"""
+Middleware for Core App.
+"""
+
+from django.urls import reverse
+
+from .views import healthz
+
+
+class HealthCheckMiddleware:
+    """
+    Answer the liveness probe before the rest of the middleware chain runs.
+
+    Must be first in MIDDLEWARE so pings skip CORS, session, CSRF and auth
+    processing entirely.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.healthz_path = reverse('healthz')
+
+    def __call__(self, request):
+        if request.path == self.healthz_path:
+            return healthz(request)
+        return self.get_response(request)
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:30
+
+from django.db import migrations, models
+
+
+def backfill_device_count(apps, schema_editor):
+    NetworkScanLog = apps.get_model('core', 'NetworkScanLog')
+    scans = []
+    for scan in NetworkScanLog.objects.only('id', 'json_payload').iterator(chunk_size=2000):
+        devices = (scan.json_payload or {}).get('devices', [])
+        scan.device_count = len(devices) if isinstance(devices, list) else 0
+        scans.append(scan)
+        # Write each chunk as it is read so the table is never held in memory
+        if len(scans) == 2000:
+            NetworkScanLog.objects.bulk_update(scans, ['device_count'], batch_size=500)
+            scans = []
+    if scans:
+        NetworkScanLog.objects.bulk_update(scans, ['device_count'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='networkscanlog',
+            name='device_count',
+            field=models.PositiveIntegerField(default=0, help_text='Number of devices in the payload, stored at write time'),
+        ),
+        migrations.RunPython(backfill_device_count, migrations.RunPython.noop),
+    ]
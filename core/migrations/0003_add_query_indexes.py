@@ -0,0 +1,45 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_networkscanlog_device_count'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='networkdevice',
+            index=models.Index(fields=['owner', '-last_seen_at'], name='core_networ_owner_i_f3776a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='networkscanlog',
+            index=models.Index(fields=['owner', '-created_at'], name='core_networ_owner_i_5736e9_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='networkscanlog',
+            index=models.Index(fields=['-created_at'], name='core_networ_created_1ccb79_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parentalrule',
+            index=models.Index(fields=['parent', '-created_at'], name='core_parent_parent__e766c7_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parentalrule',
+            index=models.Index(fields=['rule_type'], name='core_parent_rule_ty_89e269_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privacycheck',
+            index=models.Index(fields=['user', '-created_at'], name='core_privac_user_id_e01ada_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='privacycheck',
+            index=models.Index(fields=['suggested_action'], name='core_privac_suggest_fdb123_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='ruleviolation',
+            index=models.Index(fields=['-occurred_at'], name='core_rulevi_occurre_139508_idx'),
+        ),
+    ]
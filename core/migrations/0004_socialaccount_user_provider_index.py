@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_add_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='socialaccount',
+            index=models.Index(fields=['user', 'provider'], name='core_social_user_id_6c5c63_idx'),
+        ),
+    ]
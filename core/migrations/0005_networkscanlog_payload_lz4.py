@@ -0,0 +1,39 @@
+from django.db import DatabaseError, migrations, transaction
+
+
+def _set_payload_compression(schema_editor, method):
+    connection = schema_editor.connection
+    # Per-column compression is PostgreSQL 14+ only
+    if connection.vendor != 'postgresql' or connection.pg_version < 140000:
+        return
+
+    sql = 'ALTER TABLE {table} ALTER COLUMN {column} SET COMPRESSION {method}'.format(
+        table=schema_editor.quote_name('core_networkscanlog'),
+        column=schema_editor.quote_name('json_payload'),
+        method=method,
+    )
+    try:
+        with transaction.atomic(using=connection.alias):
+            schema_editor.execute(sql)
+    except DatabaseError:
+        # Server built without lz4; keep the default pglz compression
+        pass
+
+
+def use_lz4(apps, schema_editor):
+    _set_payload_compression(schema_editor, 'lz4')
+
+
+def use_default(apps, schema_editor):
+    _set_payload_compression(schema_editor, 'default')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_socialaccount_user_provider_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(use_lz4, use_default),
+    ]
@@ -0,0 +1,45 @@
+from django.db import migrations, models
+
+LEVELS = {'LOW': 0, 'MEDIUM': 1, 'HIGH': 2}
+
+
+def levels_to_int(apps, schema_editor):
+    PrivacyCheck = apps.get_model('core', 'PrivacyCheck')
+    for name, value in LEVELS.items():
+        PrivacyCheck.objects.filter(network_usage_level=name).update(network_usage_level_int=value)
+
+
+def levels_to_str(apps, schema_editor):
+    PrivacyCheck = apps.get_model('core', 'PrivacyCheck')
+    for name, value in LEVELS.items():
+        PrivacyCheck.objects.filter(network_usage_level_int=value).update(network_usage_level=name)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_networkscanlog_payload_lz4'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='privacycheck',
+            name='network_usage_level_int',
+            field=models.PositiveSmallIntegerField(default=1),
+        ),
+        migrations.RunPython(levels_to_int, levels_to_str),
+        migrations.RemoveField(
+            model_name='privacycheck',
+            name='network_usage_level',
+        ),
+        migrations.RenameField(
+            model_name='privacycheck',
+            old_name='network_usage_level_int',
+            new_name='network_usage_level',
+        ),
+        migrations.AlterField(
+            model_name='privacycheck',
+            name='network_usage_level',
+            field=models.PositiveSmallIntegerField(choices=[(0, 'Low'), (1, 'Medium'), (2, 'High')], default=1),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-14 19:39
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_privacycheck_network_usage_level_int'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appprivacyprofile',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['permissions'], name='aprof_perm_gin', opclasses=['jsonb_path_ops']),
+        ),
+    ]
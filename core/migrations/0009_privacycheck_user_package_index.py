@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0008_user_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='privacycheck',
+            index=models.Index(fields=['user', 'app_package_name', '-created_at'], name='core_privac_user_id_a8d174_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_privacycheck_user_package_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='ruleviolation',
+            index=models.Index(fields=['child', '-occurred_at'], name='core_rulevi_child_i_9f69cc_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 09:41
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_ruleviolation_child_occurred_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='childprofile',
+            index=models.Index(fields=['user', 'name'], name='core_childp_user_id_83136b_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='parentalrule',
+            index=models.Index(fields=['parent', 'child', '-created_at'], name='core_parent_parent__1621b7_idx'),
+        ),
+    ]
@@ -3,10 +3,12 @@ Core models for Antygravity Backend.
 """
 
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 
-from .managers import UserManager
+from .managers import UserManager, SelectRelatedManager
 
 
 # =============================================================================
@@ -39,6 +41,11 @@ class User(AbstractBaseUser, PermissionsMixin):
         verbose_name = 'user'
         verbose_name_plural = 'users'
         ordering = ['-date_joined']
+        indexes = [
+            # Admin search uses icontains, which compiles to UPPER(col) LIKE UPPER('%q%')
+            GinIndex(OpClass(Upper('email'), name='gin_trgm_ops'), name='user_email_trgm'),
+            GinIndex(OpClass(Upper('full_name'), name='gin_trgm_ops'), name='user_name_trgm'),
+        ]
 
     def __str__(self):
         return self.email
@@ -74,6 +81,9 @@ class SocialAccount(models.Model):
         verbose_name = 'social account'
         verbose_name_plural = 'social accounts'
         unique_together = [['provider', 'provider_user_id']]
+        indexes = [
+            models.Index(fields=['user', 'provider']),
+        ]
 
     def __str__(self):
         return f"{self.user.email} - {self.provider}"
@@ -106,6 +116,9 @@ class ChildProfile(models.Model):
         verbose_name = 'child profile'
         verbose_name_plural = 'child profiles'
         ordering = ['name']
+        indexes = [
+            models.Index(fields=['user', 'name']),
+        ]
 
     def __str__(self):
         return f"{self.name} (child of {self.user.email})"
@@ -164,10 +177,19 @@ class ParentalRule(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = models.Manager()
+    # Joins what __str__ renders, for shell and logging use; API views use objects
+    objects_ui = SelectRelatedManager('child__user', 'parent')
+
     class Meta:
         verbose_name = 'parental rule'
         verbose_name_plural = 'parental rules'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['parent', '-created_at']),
+            models.Index(fields=['parent', 'child', '-created_at']),
+            models.Index(fields=['rule_type']),
+        ]
 
     def __str__(self):
         return f"{self.rule_type} for {self.child.name}"
@@ -189,10 +211,17 @@ class RuleViolation(models.Model):
     occurred_at = models.DateTimeField(auto_now_add=True)
     description = models.TextField(blank=True, default='')
 
+    objects = models.Manager()
+    objects_ui = SelectRelatedManager('rule__child', 'child__user')
+
     class Meta:
         verbose_name = 'rule violation'
         verbose_name_plural = 'rule violations'
         ordering = ['-occurred_at']
+        indexes = [
+            models.Index(fields=['-occurred_at']),
+            models.Index(fields=['child', '-occurred_at']),
+        ]
 
     def __str__(self):
         return f"Violation of {self.rule.rule_type} by {self.child.name}"
@@ -239,6 +268,9 @@ class NetworkDevice(models.Model):
         verbose_name_plural = 'network devices'
         ordering = ['-last_seen_at']
         unique_together = [['owner', 'mac_address']]
+        indexes = [
+            models.Index(fields=['owner', '-last_seen_at']),
+        ]
 
     def __str__(self):
         return f"{self.name or self.ip_address} ({self.device_type})"
@@ -256,11 +288,19 @@ class NetworkScanLog(models.Model):
     network_ssid = models.CharField(max_length=255, blank=True, null=True)
     network_bssid = models.CharField(max_length=17, blank=True, null=True)
     json_payload = models.JSONField(default=dict)
+    device_count = models.PositiveIntegerField(
+        default=0,
+        help_text='Number of devices in the payload, stored at write time'
+    )
 
     class Meta:
         verbose_name = 'network scan log'
         verbose_name_plural = 'network scan logs'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['owner', '-created_at']),
+            models.Index(fields=['-created_at']),
+        ]
 
     def __str__(self):
         return f"Scan by {self.owner.email} at {self.created_at}"
@@ -284,6 +324,10 @@ class AppPrivacyProfile(models.Model):
         verbose_name = 'app privacy profile'
         verbose_name_plural = 'app privacy profiles'
         ordering = ['app_name']
+        indexes = [
+            # Serves permissions__contains lookups
+            GinIndex(fields=['permissions'], name='aprof_perm_gin', opclasses=['jsonb_path_ops']),
+        ]
 
     def __str__(self):
         return f"{self.app_name} ({self.package_name})"
@@ -297,10 +341,10 @@ class PrivacyCheck(models.Model):
         REVIEW = 'REVIEW', 'Review Permissions'
         CONSIDER_UNINSTALL = 'CONSIDER_UNINSTALL', 'Consider Uninstalling'
 
-    class NetworkUsageLevel(models.TextChoices):
-        LOW = 'LOW', 'Low'
-        MEDIUM = 'MEDIUM', 'Medium'
-        HIGH = 'HIGH', 'High'
+    class NetworkUsageLevel(models.IntegerChoices):
+        LOW = 0, 'Low'
+        MEDIUM = 1, 'Medium'
+        HIGH = 2, 'High'
 
     user = models.ForeignKey(
         User,
@@ -311,8 +355,7 @@ class PrivacyCheck(models.Model):
     app_package_name = models.CharField(max_length=255)
     app_name = models.CharField(max_length=255)
     permissions = models.JSONField(default=list)
-    network_usage_level = models.CharField(
-        max_length=10,
+    network_usage_level = models.PositiveSmallIntegerField(
         choices=NetworkUsageLevel.choices,
         default=NetworkUsageLevel.MEDIUM
     )
@@ -327,6 +370,11 @@ class PrivacyCheck(models.Model):
         verbose_name = 'privacy check'
         verbose_name_plural = 'privacy checks'
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', '-created_at']),
+            models.Index(fields=['user', 'app_package_name', '-created_at']),
+            models.Index(fields=['suggested_action']),
+        ]
 
     def __str__(self):
         return f"Check for {self.app_name} by {self.user.email}"
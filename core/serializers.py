@@ -33,6 +33,30 @@ class UserSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'email', 'date_joined']
 
 
+# Columns serialize_user reads, for callers that load users with only()
+USER_PAYLOAD_FIELDS = ('id', 'email', 'full_name', 'avatar_url', 'is_parent', 'date_joined')
+
+# Formats date_joined exactly as UserSerializer does
+_date_joined_field = serializers.DateTimeField()
+
+
+def serialize_user(user):
+    """
+    Build UserSerializer's output for a single user from plain attributes.
+
+    Auth responses render one user per request, where building and copying
+    the serializer's fields costs more than reading six attributes.
+    """
+    return {
+        'id': user.id,
+        'email': user.email,
+        'full_name': user.full_name,
+        'avatar_url': user.avatar_url,
+        'is_parent': user.is_parent,
+        'date_joined': _date_joined_field.to_representation(user.date_joined),
+    }
+
+
 class UserUpdateSerializer(serializers.ModelSerializer):
     """Serializer for updating user profile."""
 
@@ -132,12 +156,15 @@ class ParentalRuleSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at']
 
-    def validate_child(self, value):
-        # Ensure child belongs to the current user
+    def get_fields(self):
+        fields = super().get_fields()
+        # Only the current user's children resolve, so ownership is checked
+        # by the same query that looks the child up
         request = self.context.get('request')
-        if request and value.user != request.user:
-            raise serializers.ValidationError('Child does not belong to you.')
-        return value
+        if request:
+            fields['child'].queryset = ChildProfile.objects.filter(user=request.user)
+            fields['child'].error_messages['does_not_exist'] = 'Child does not belong to you.'
+        return fields
 
     def create(self, validated_data):
         validated_data['parent'] = self.context['request'].user
@@ -155,17 +182,16 @@ class RuleViolationSerializer(serializers.ModelSerializer):
         fields = ['id', 'child', 'child_name', 'rule', 'rule_type', 'occurred_at', 'description']
         read_only_fields = ['id', 'occurred_at']
 
-    def validate(self, attrs):
+    def get_fields(self):
+        fields = super().get_fields()
+        # Restrict lookups to objects owned by the current user
         request = self.context.get('request')
-        child = attrs.get('child')
-        rule = attrs.get('rule')
-
-        if child and child.user != request.user:
-            raise serializers.ValidationError({'child': 'Child does not belong to you.'})
-        if rule and rule.parent != request.user:
-            raise serializers.ValidationError({'rule': 'Rule does not belong to you.'})
-
-        return attrs
+        if request:
+            fields['child'].queryset = ChildProfile.objects.filter(user=request.user)
+            fields['child'].error_messages['does_not_exist'] = 'Child does not belong to you.'
+            fields['rule'].queryset = ParentalRule.objects.filter(parent=request.user)
+            fields['rule'].error_messages['does_not_exist'] = 'Rule does not belong to you.'
+        return fields
 
 
 # =============================================================================
@@ -195,18 +221,13 @@ class NetworkDeviceCreateSerializer(serializers.ModelSerializer):
 class NetworkScanLogSerializer(serializers.ModelSerializer):
     """Serializer for network scan logs."""
 
-    devices_count = serializers.SerializerMethodField()
+    devices_count = serializers.IntegerField(source='device_count', read_only=True)
 
     class Meta:
         model = NetworkScanLog
         fields = ['id', 'created_at', 'network_ssid', 'network_bssid', 'devices_count']
         read_only_fields = ['id', 'created_at']
 
-    def get_devices_count(self, obj):
-        payload = obj.json_payload or {}
-        devices = payload.get('devices', [])
-        return len(devices) if isinstance(devices, list) else 0
-
 
 class NetworkScanCreateSerializer(serializers.Serializer):
     """Serializer for creating a network scan with devices."""
@@ -224,6 +245,27 @@ class NetworkScanCreateSerializer(serializers.Serializer):
 # Privacy Serializers
 # =============================================================================
 
+# Built once at import; ChoiceField rebuilds its choice maps per serializer instance
+_NETWORK_USAGE_LEVELS = {level.name: level for level in PrivacyCheck.NetworkUsageLevel}
+
+
+class NetworkUsageLevelField(serializers.Field):
+    """Exposes a NetworkUsageLevel by name while storing its integer value."""
+
+    default_error_messages = {
+        'invalid_choice': '"{input}" is not a valid choice.',
+    }
+
+    def to_internal_value(self, data):
+        try:
+            return _NETWORK_USAGE_LEVELS[data]
+        except (KeyError, TypeError):
+            self.fail('invalid_choice', input=data)
+
+    def to_representation(self, value):
+        return PrivacyCheck.NetworkUsageLevel(value).name
+
+
 class AppPrivacyProfileSerializer(serializers.ModelSerializer):
     """Serializer for app privacy profiles."""
 
@@ -239,6 +281,8 @@ class AppPrivacyProfileSerializer(serializers.ModelSerializer):
 class PrivacyCheckSerializer(serializers.ModelSerializer):
     """Serializer for privacy check results."""
 
+    network_usage_level = NetworkUsageLevelField(required=False)
+
     class Meta:
         model = PrivacyCheck
         fields = [
@@ -263,7 +307,12 @@ class PrivacyCheckRequestSerializer(serializers.Serializer):
         required=False,
         default=list
     )
-    network_usage_level = serializers.ChoiceField(
-        choices=['LOW', 'MEDIUM', 'HIGH'],
-        default='MEDIUM'
+    network_usage_level = NetworkUsageLevelField(
+        default=PrivacyCheck.NetworkUsageLevel.MEDIUM
     )
+
+
+class PrivacyCheckBatchRequestSerializer(serializers.Serializer):
+    """Serializer for a batch of privacy check requests."""
+
+    apps = PrivacyCheckRequestSerializer(many=True, allow_empty=False, max_length=200)
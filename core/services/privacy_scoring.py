@@ -4,7 +4,8 @@ Privacy Scoring Service for Antygravity.
 Calculates privacy risk scores based on app permissions, category, and network usage.
 """
 
-from typing import Tuple
+from functools import lru_cache
+from typing import Sequence, Tuple
 
 # Permission risk levels (higher = more risky)
 DANGEROUS_PERMISSIONS = {
@@ -66,6 +67,46 @@ CATEGORY_ADJUSTMENTS = {
     'utilities': {'expected_permissions': [], 'base_penalty': 0},
 }
 
+# Flattened view of CATEGORY_ADJUSTMENTS for scoring, keyed like the normalized category
+CATEGORY_PENALTIES = {name: info['base_penalty'] for name, info in CATEGORY_ADJUSTMENTS.items()}
+
+_CATEGORY_KEY_TRANSLATION = str.maketrans(' &', '__')
+
+
+def _simplify_permission_name(permission: str) -> str:
+    """Convert Android permission to a human-readable name."""
+    # Remove android.permission. prefix
+    simple = permission.replace('android.permission.', '')
+    # Convert to title case with spaces
+    simple = simple.replace('_', ' ').title()
+    return simple
+
+
+# Display names for DANGEROUS_PERMISSIONS, so scoring does no string work per call
+PERMISSION_LABELS = {perm: _simplify_permission_name(perm) for perm in DANGEROUS_PERMISSIONS}
+
+# Bitmask encoding of DANGEROUS_PERMISSIONS: bit i is the i-th permission above
+PERMISSION_BITS = {perm: 1 << i for i, perm in enumerate(DANGEROUS_PERMISSIONS)}
+
+HIGH_RISK_MASK = sum(PERMISSION_BITS[p] for p, v in DANGEROUS_PERMISSIONS.items() if v >= 15)
+MEDIUM_RISK_MASK = sum(PERMISSION_BITS[p] for p, v in DANGEROUS_PERMISSIONS.items() if 8 <= v < 15)
+
+
+def _build_penalty_byte_tables() -> Tuple[Tuple[int, ...], ...]:
+    # Total penalty for every value of each 8-bit slice of the mask
+    penalties = tuple(DANGEROUS_PERMISSIONS.values())
+    tables = []
+    for offset in range(0, len(penalties), 8):
+        chunk = penalties[offset:offset + 8]
+        tables.append(tuple(
+            sum(p for bit, p in enumerate(chunk) if value >> bit & 1)
+            for value in range(256)
+        ))
+    return tuple(tables)
+
+
+_PENALTY_BYTE_TABLES = _build_penalty_byte_tables()
+
 
 def calculate_privacy_score(
     permissions: list[str],
@@ -86,6 +127,22 @@ def calculate_privacy_score(
         - explanation: Human-readable explanation of the score
         - suggested_action: 'KEEP', 'REVIEW', or 'CONSIDER_UNINSTALL'
     """
+    # Normalized once; _score and the memoized path take the upper-case level
+    level = network_usage_level.upper()
+
+    if not permissions:
+        # Only the category and network usage vary here, so results repeat
+        return _score_without_permissions(category, level)
+
+    return _score(permissions, category, level)
+
+
+def _score(
+    permissions: Sequence[str],
+    category: str,
+    network_usage_level: str
+) -> Tuple[int, str, str]:
+    """Score an app; see calculate_privacy_score for arguments and result."""
     base_score = 100
     deductions = []
     concerns = []
@@ -96,15 +153,19 @@ def calculate_privacy_score(
     high_risk_permissions = []
     medium_risk_permissions = []
 
+    mask = 0
     for perm in permissions:
-        perm_upper = perm.upper()
-        if perm in DANGEROUS_PERMISSIONS:
-            penalty = DANGEROUS_PERMISSIONS[perm]
-            permission_penalty += penalty
-            if penalty >= 15:
-                high_risk_permissions.append(_simplify_permission_name(perm))
-            elif penalty >= 8:
-                medium_risk_permissions.append(_simplify_permission_name(perm))
+        bit = PERMISSION_BITS.get(perm, 0)
+        if bit & ~mask:
+            # First occurrence of a dangerous permission
+            mask |= bit
+            if bit & HIGH_RISK_MASK:
+                high_risk_permissions.append(PERMISSION_LABELS[perm])
+            elif bit & MEDIUM_RISK_MASK:
+                medium_risk_permissions.append(PERMISSION_LABELS[perm])
+
+    if mask:
+        permission_penalty = _mask_penalty(mask)
 
     # Cap permission penalty at 60 points
     permission_penalty = min(permission_penalty, 60)
@@ -112,14 +173,13 @@ def calculate_privacy_score(
         deductions.append(f"Permissions: -{permission_penalty} points")
 
     # Network usage penalty
-    network_penalty = NETWORK_USAGE_PENALTIES.get(network_usage_level.upper(), 5)
+    network_penalty = NETWORK_USAGE_PENALTIES.get(network_usage_level, 5)
     if network_penalty > 0:
         deductions.append(f"Network usage ({network_usage_level}): -{network_penalty} points")
 
     # Category adjustment
-    category_lower = category.lower().replace(' ', '_').replace('&', '_')
-    category_info = CATEGORY_ADJUSTMENTS.get(category_lower, {'expected_permissions': [], 'base_penalty': 0})
-    category_penalty = category_info['base_penalty']
+    category_key = category.lower().translate(_CATEGORY_KEY_TRANSLATION)
+    category_penalty = CATEGORY_PENALTIES.get(category_key, 0)
     if category_penalty != 0:
         if category_penalty > 0:
             deductions.append(f"Category risk ({category}): -{category_penalty} points")
@@ -135,7 +195,7 @@ def calculate_privacy_score(
         concerns.append(f"High-risk permissions: {', '.join(high_risk_permissions)}")
     if medium_risk_permissions:
         concerns.append(f"Sensitive permissions: {', '.join(medium_risk_permissions[:5])}")
-    if network_usage_level.upper() == 'HIGH':
+    if network_usage_level == 'HIGH':
         concerns.append("High network activity may indicate data sharing")
 
     if final_score >= 80:
@@ -165,10 +225,16 @@ def calculate_privacy_score(
     return final_score, explanation, suggested_action
 
 
-def _simplify_permission_name(permission: str) -> str:
-    """Convert Android permission to a human-readable name."""
-    # Remove android.permission. prefix
-    simple = permission.replace('android.permission.', '')
-    # Convert to title case with spaces
-    simple = simple.replace('_', ' ').title()
-    return simple
+@lru_cache(maxsize=256)
+def _score_without_permissions(category: str, network_usage_level: str) -> Tuple[int, str, str]:
+    """Memoized score for an app that requests no permissions."""
+    return _score((), category, network_usage_level)
+
+
+def _mask_penalty(mask: int) -> int:
+    """Sum the penalties of all permissions set in a mask, one table lookup per byte."""
+    total = 0
+    for table in _PENALTY_BYTE_TABLES:
+        total += table[mask & 0xFF]
+        mask >>= 8
+    return total
@@ -4,15 +4,19 @@ Social Authentication Service for Antygravity.
 Handles verification of Google and Apple OAuth tokens.
 """
 
-from typing import Optional, Dict, Any
+import hashlib
+import threading
+import time
+from typing import Callable, Dict, Any, Optional, Tuple
+
 from django.conf import settings
+from django.core.cache import cache
 
 # Google Auth
-from google.oauth2 import id_token
-from google.auth.transport import requests as google_requests
+from google.auth import jwt as google_jwt
 
-# Apple Auth (using python-jose for JWT verification)
-from jose import jwt, JWTError
+# Apple Auth (using python-jose for JWT verification; also reads Google token headers)
+from jose import jwk, jwt, JWTError
 import requests
 
 
@@ -21,6 +25,71 @@ class SocialAuthError(Exception):
     pass
 
 
+# One pooled session per process, so repeat calls to Google and Apple
+# reuse open TLS connections instead of handshaking every time
+_http_session = requests.Session()
+
+# Coalesces concurrent key fetches within a process on a cold cache
+_public_keys_lock = threading.Lock()
+
+# Verified claims are reused for retries of the same token, never past its expiry
+VERIFIED_TOKEN_CACHE_TIMEOUT = 60
+
+
+def _get_public_keys(cache_key: str, url: str, cache_timeout: int,
+                     parse: Callable[[Any], Dict[str, Any]]) -> Dict[str, Any]:
+    """Return a provider's signing keys by key ID, fetching them on a cache miss."""
+    keys = cache.get(cache_key)
+    if keys is not None:
+        return keys
+
+    with _public_keys_lock:
+        # Another thread may have filled the cache while we waited
+        keys = cache.get(cache_key)
+        if keys is not None:
+            return keys
+
+        response = _http_session.get(url, timeout=10)
+        response.raise_for_status()
+
+        keys = parse(response.json())
+        cache.set(cache_key, keys, cache_timeout)
+        return keys
+
+
+def _verified_token_cache_key(provider: str, token: str) -> str:
+    return f'social_token:{provider}:{hashlib.sha256(token.encode()).hexdigest()}'
+
+
+def _get_verified_claims(provider: str, token: str) -> Optional[Dict[str, Any]]:
+    return cache.get(_verified_token_cache_key(provider, token))
+
+
+def _set_verified_claims(provider: str, token: str, claims: Dict[str, Any], exp: int) -> None:
+    timeout = min(VERIFIED_TOKEN_CACHE_TIMEOUT, int(exp - time.time()))
+    if timeout > 0:
+        cache.set(_verified_token_cache_key(provider, token), claims, timeout)
+
+
+# Google's signing certificates, as PEM strings keyed by key ID
+GOOGLE_CERTS_URL = 'https://www.googleapis.com/oauth2/v1/certs'
+GOOGLE_CERTS_CACHE_KEY = 'google_certs'
+GOOGLE_CERTS_CACHE_TIMEOUT = 60 * 60
+
+# Issuers Google signs ID tokens with
+GOOGLE_ISSUERS = frozenset({'accounts.google.com', 'https://accounts.google.com'})
+
+
+def _get_google_certs() -> Dict[str, str]:
+    """Fetch Google's ID token signing certificates, indexed by key ID."""
+    try:
+        return _get_public_keys(
+            GOOGLE_CERTS_CACHE_KEY, GOOGLE_CERTS_URL, GOOGLE_CERTS_CACHE_TIMEOUT, dict
+        )
+    except requests.RequestException as e:
+        raise SocialAuthError(f'Failed to fetch Google certificates: {str(e)}')
+
+
 def verify_google_token(token: str) -> Dict[str, Any]:
     """
     Verify a Google ID token and extract user information.
@@ -39,27 +108,39 @@ def verify_google_token(token: str) -> Dict[str, Any]:
     Raises:
         SocialAuthError: If token verification fails
     """
+    claims = _get_verified_claims('google', token)
+    if claims is not None:
+        return claims
+
     try:
-        # Verify the token with Google's servers
-        idinfo = id_token.verify_oauth2_token(
-            token,
-            google_requests.Request(),
-            settings.GOOGLE_CLIENT_ID
-        )
+        kid = jwt.get_unverified_header(token).get('kid')
+
+        if not kid:
+            raise SocialAuthError('No key ID in token header')
+
+        certs = _get_google_certs()
+        if kid not in certs:
+            # Google rotated its keys; refetch once
+            cache.delete(GOOGLE_CERTS_CACHE_KEY)
+            certs = _get_google_certs()
+
+        idinfo = google_jwt.decode(token, certs=certs, audience=settings.GOOGLE_CLIENT_ID)
 
         # Verify the issuer
-        if idinfo['iss'] not in ['accounts.google.com', 'https://accounts.google.com']:
+        if idinfo['iss'] not in GOOGLE_ISSUERS:
             raise SocialAuthError('Invalid token issuer')
 
-        return {
+        claims = {
             'sub': idinfo['sub'],
             'email': idinfo.get('email', ''),
             'email_verified': idinfo.get('email_verified', False),
             'name': idinfo.get('name', ''),
             'picture': idinfo.get('picture', ''),
         }
+        _set_verified_claims('google', token, claims, idinfo['exp'])
+        return claims
 
-    except ValueError as e:
+    except (ValueError, JWTError) as e:
         raise SocialAuthError(f'Invalid Google token: {str(e)}')
     except Exception as e:
         raise SocialAuthError(f'Google token verification failed: {str(e)}')
@@ -68,26 +149,35 @@ def verify_google_token(token: str) -> Dict[str, Any]:
 # Apple's public key URL
 APPLE_PUBLIC_KEY_URL = 'https://appleid.apple.com/auth/keys'
 
-# Cache for Apple's public keys
-_apple_public_keys_cache: Optional[Dict] = None
+# Apple rotates its signing keys rarely; an unknown key ID forces a refetch
+APPLE_PUBLIC_KEYS_CACHE_KEY = 'apple_public_keys'
+APPLE_PUBLIC_KEYS_CACHE_TIMEOUT = 60 * 60
 
+# Constructed key objects by kid, alongside the JWK they were built from.
+# They cannot be pickled into the shared cache, so each process keeps its own.
+_apple_key_objects: Dict[str, Tuple[Dict, Any]] = {}
 
-def _get_apple_public_keys() -> Dict:
-    """Fetch Apple's public keys for token verification."""
-    global _apple_public_keys_cache
-
-    if _apple_public_keys_cache is not None:
-        return _apple_public_keys_cache
 
+def _get_apple_public_keys() -> Dict[str, Dict]:
+    """Fetch Apple's public keys for token verification, indexed by key ID."""
     try:
-        response = requests.get(APPLE_PUBLIC_KEY_URL, timeout=10)
-        response.raise_for_status()
-        _apple_public_keys_cache = response.json()
-        return _apple_public_keys_cache
+        return _get_public_keys(
+            APPLE_PUBLIC_KEYS_CACHE_KEY, APPLE_PUBLIC_KEY_URL, APPLE_PUBLIC_KEYS_CACHE_TIMEOUT,
+            lambda data: {key['kid']: key for key in data.get('keys', []) if key.get('kid')},
+        )
     except requests.RequestException as e:
         raise SocialAuthError(f'Failed to fetch Apple public keys: {str(e)}')
 
 
+def _get_apple_key_object(kid: str, key_data: Dict) -> Any:
+    """Return the verification key for a JWK, building it only the first time it is seen."""
+    entry = _apple_key_objects.get(kid)
+    if entry is None or entry[0] != key_data:
+        entry = (key_data, jwk.construct(key_data, algorithm='RS256'))
+        _apple_key_objects[kid] = entry
+    return entry[1]
+
+
 def verify_apple_token(token: str) -> Dict[str, Any]:
     """
     Verify an Apple ID token and extract user information.
@@ -104,6 +194,10 @@ def verify_apple_token(token: str) -> Dict[str, Any]:
     Raises:
         SocialAuthError: If token verification fails
     """
+    claims = _get_verified_claims('apple', token)
+    if claims is not None:
+        return claims
+
     try:
         # Get unverified header to find the key ID
         unverified_header = jwt.get_unverified_header(token)
@@ -116,22 +210,12 @@ def verify_apple_token(token: str) -> Dict[str, Any]:
         apple_keys = _get_apple_public_keys()
 
         # Find the matching key
-        matching_key = None
-        for key in apple_keys.get('keys', []):
-            if key.get('kid') == kid:
-                matching_key = key
-                break
+        matching_key = apple_keys.get(kid)
 
         if not matching_key:
             # Invalidate cache and retry once
-            global _apple_public_keys_cache
-            _apple_public_keys_cache = None
-            apple_keys = _get_apple_public_keys()
-
-            for key in apple_keys.get('keys', []):
-                if key.get('kid') == kid:
-                    matching_key = key
-                    break
+            cache.delete(APPLE_PUBLIC_KEYS_CACHE_KEY)
+            matching_key = _get_apple_public_keys().get(kid)
 
         if not matching_key:
             raise SocialAuthError('Unable to find matching Apple public key')
@@ -139,17 +223,19 @@ def verify_apple_token(token: str) -> Dict[str, Any]:
         # Verify the token
         payload = jwt.decode(
             token,
-            matching_key,
+            _get_apple_key_object(kid, matching_key),
             algorithms=['RS256'],
             audience=settings.APPLE_CLIENT_ID,
             issuer='https://appleid.apple.com'
         )
 
-        return {
+        claims = {
             'sub': payload['sub'],
             'email': payload.get('email', ''),
             'email_verified': payload.get('email_verified', False),
         }
+        _set_verified_claims('apple', token, claims, payload['exp'])
+        return claims
 
     except JWTError as e:
         raise SocialAuthError(f'Invalid Apple token: {str(e)}')
@@ -0,0 +1,57 @@
+"""
+Tests for Core App.
+"""
+
+from datetime import datetime
+
+from django.contrib.auth import get_user_model
+from django.utils import timezone
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from .models import ChildProfile, ParentalRule, RuleViolation
+
+User = get_user_model()
+
+
+class RuleViolationDateFilterTests(APITestCase):
+    url = '/api/parental/violations/'
+
+    def setUp(self):
+        self.user = User.objects.create_user(email='parent@example.com', password='secret-pass-123')
+        self.client.force_authenticate(self.user)
+
+        child = ChildProfile.objects.create(user=self.user, name='Sam')
+        rule = ParentalRule.objects.create(
+            parent=self.user,
+            child=child,
+            rule_type=ParentalRule.RuleType.BLOCK_APP,
+            app_package_name='com.example.game',
+        )
+        self.violation = RuleViolation.objects.create(child=child, rule=rule)
+        RuleViolation.objects.filter(pk=self.violation.pk).update(
+            occurred_at=timezone.make_aware(datetime(2024, 5, 10, 18, 30))
+        )
+
+    def test_end_date_includes_the_whole_day(self):
+        response = self.client.get(self.url, {'end_date': '2024-05-10'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([v['id'] for v in response.data['results']], [self.violation.pk])
+
+    def test_end_date_before_violation_excludes_it(self):
+        response = self.client.get(self.url, {'end_date': '2024-05-09'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['results'], [])
+
+    def test_max_end_date_is_accepted(self):
+        response = self.client.get(self.url, {'end_date': '9999-12-31'})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual([v['id'] for v in response.data['results']], [self.violation.pk])
+
+    def test_invalid_end_date_is_rejected(self):
+        response = self.client.get(self.url, {'end_date': '2024-13-01'})
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -14,6 +14,7 @@ from .views import (
     NetworkScanLogViewSet,
     PrivacyCheckView,
     PrivacyCheckListView,
+    PrivacyCheckBatchView,
 )
 from .views_auth import (
     RegisterView,
@@ -43,6 +44,7 @@ urlpatterns = [
     # Privacy endpoints
     path('privacy/check/', PrivacyCheckView.as_view(), name='privacy-check'),
     path('privacy/checks/', PrivacyCheckListView.as_view(), name='privacy-checks'),
+    path('privacy/checks/batch/', PrivacyCheckBatchView.as_view(), name='privacy-checks-batch'),
 
     # Include router URLs
     path('', include(router.urls)),
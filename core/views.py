@@ -2,9 +2,15 @@
 API Views for Antygravity Backend.
 """
 
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+
+from django.db import transaction
+from django.http import HttpResponse
 from django.utils import timezone
-from rest_framework import viewsets, status
+from rest_framework import generics, viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.views import APIView
@@ -26,10 +32,23 @@ from .serializers import (
     NetworkScanCreateSerializer,
     PrivacyCheckSerializer,
     PrivacyCheckRequestSerializer,
+    PrivacyCheckBatchRequestSerializer,
 )
 from .services.privacy_scoring import calculate_privacy_score
 
 
+# =============================================================================
+# Health Check
+# =============================================================================
+
+def healthz(request):
+    """
+    GET /healthz/
+    Liveness probe for uptime pingers; touches no database or templates.
+    """
+    return HttpResponse(b'ok', content_type='text/plain')
+
+
 # =============================================================================
 # Child Profile ViewSet
 # =============================================================================
@@ -66,7 +85,10 @@ class ParentalRuleViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        queryset = ParentalRule.objects.filter(parent=self.request.user)
+        # child_name is rendered per row
+        queryset = ParentalRule.objects.filter(
+            parent=self.request.user
+        ).select_related('child')
 
         # Optional filter by child
         child_id = self.request.query_params.get('child_id')
@@ -89,24 +111,48 @@ class RuleViolationViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
 
     def get_queryset(self):
-        queryset = RuleViolation.objects.filter(child__user=self.request.user)
+        # child_name and rule_type are rendered per row
+        queryset = RuleViolation.objects.filter(
+            child__user=self.request.user
+        ).select_related('child', 'rule')
 
         # Filter by child
         child_id = self.request.query_params.get('child_id')
         if child_id:
             queryset = queryset.filter(child_id=child_id)
 
-        # Filter by date range
-        start_date = self.request.query_params.get('start_date')
+        # Filter by date range, as bounds on the raw column so its index applies
+        start_date = self._parse_date_param('start_date')
         if start_date:
-            queryset = queryset.filter(occurred_at__date__gte=start_date)
+            queryset = queryset.filter(
+                occurred_at__gte=self._start_of_day('start_date', start_date)
+            )
 
-        end_date = self.request.query_params.get('end_date')
-        if end_date:
-            queryset = queryset.filter(occurred_at__date__lte=end_date)
+        end_date = self._parse_date_param('end_date')
+        # date.max has no next day to bound by, and nothing can fall after it
+        if end_date and end_date != date.max:
+            queryset = queryset.filter(
+                occurred_at__lt=self._start_of_day('end_date', end_date + timedelta(days=1))
+            )
 
         return queryset
 
+    def _parse_date_param(self, name):
+        value = self.request.query_params.get(name)
+        if not value:
+            return None
+        try:
+            return date.fromisoformat(value)
+        except ValueError:
+            raise ValidationError({name: 'Date must be in YYYY-MM-DD format.'})
+
+    @staticmethod
+    def _start_of_day(name, day):
+        try:
+            return timezone.make_aware(datetime.combine(day, time.min))
+        except OverflowError:
+            raise ValidationError({name: 'Date is out of range.'})
+
 
 # =============================================================================
 # Network Monitoring ViewSets
@@ -135,7 +181,7 @@ class NetworkDeviceViewSet(viewsets.ModelViewSet):
         device = self.get_object()
         device.is_trusted = True
         device.is_blocked = False
-        device.save()
+        device.save(update_fields=['is_trusted', 'is_blocked'])
         return Response(NetworkDeviceSerializer(device).data)
 
     @action(detail=True, methods=['post'])
@@ -144,7 +190,7 @@ class NetworkDeviceViewSet(viewsets.ModelViewSet):
         device = self.get_object()
         device.is_blocked = True
         device.is_trusted = False
-        device.save()
+        device.save(update_fields=['is_trusted', 'is_blocked'])
         return Response(NetworkDeviceSerializer(device).data)
 
     @action(detail=True, methods=['post'])
@@ -153,7 +199,7 @@ class NetworkDeviceViewSet(viewsets.ModelViewSet):
         device = self.get_object()
         device.is_trusted = False
         device.is_blocked = False
-        device.save()
+        device.save(update_fields=['is_trusted', 'is_blocked'])
         return Response(NetworkDeviceSerializer(device).data)
 
 
@@ -164,6 +210,7 @@ class NetworkScanLogViewSet(viewsets.ModelViewSet):
     Creating a scan will also create/update network devices.
     """
     permission_classes = [IsAuthenticated]
+    list_fields = ('id', 'created_at', 'network_ssid', 'network_bssid', 'device_count')
 
     def get_serializer_class(self):
         if self.action == 'create':
@@ -171,7 +218,12 @@ class NetworkScanLogViewSet(viewsets.ModelViewSet):
         return NetworkScanLogSerializer
 
     def get_queryset(self):
-        return NetworkScanLog.objects.filter(owner=self.request.user)
+        queryset = NetworkScanLog.objects.filter(owner=self.request.user)
+
+        # The payload is never serialized; lists skip model instances entirely
+        if self.action == 'list':
+            return queryset.values(*self.list_fields)
+        return queryset.defer('json_payload')
 
     def create(self, request, *args, **kwargs):
         serializer = self.get_serializer(data=request.data)
@@ -181,15 +233,9 @@ class NetworkScanLogViewSet(viewsets.ModelViewSet):
         devices_data = data.get('devices', [])
         now = timezone.now()
 
-        # Create the scan log
-        scan_log = NetworkScanLog.objects.create(
-            owner=request.user,
-            network_ssid=data.get('network_ssid', ''),
-            network_bssid=data.get('network_bssid', ''),
-            json_payload={'devices': devices_data},
-        )
-
         # Process each device in the scan
+        devices_by_mac = {}
+        devices_by_ip = {}
         for device_info in devices_data:
             mac = device_info.get('mac_address', '')
             ip = device_info.get('ip_address', '')
@@ -197,52 +243,150 @@ class NetworkScanLogViewSet(viewsets.ModelViewSet):
             if not mac and not ip:
                 continue
 
-            # Try to find existing device by MAC address
+            # Devices with a MAC address are upserted together below
             if mac:
-                device, created = NetworkDevice.objects.get_or_create(
-                    owner=request.user,
-                    mac_address=mac,
-                    defaults={
-                        'ip_address': ip or '0.0.0.0',
-                        'name': device_info.get('name', ''),
-                        'device_type': device_info.get('device_type', 'UNKNOWN'),
-                        'first_seen_at': now,
-                        'last_seen_at': now,
-                    }
-                )
-            else:
-                # No MAC, use IP (less reliable)
-                device, created = NetworkDevice.objects.get_or_create(
-                    owner=request.user,
-                    ip_address=ip,
-                    mac_address='',
-                    defaults={
-                        'name': device_info.get('name', ''),
-                        'device_type': device_info.get('device_type', 'UNKNOWN'),
-                        'first_seen_at': now,
-                        'last_seen_at': now,
-                    }
-                )
-
-            if not created:
-                # Update existing device
-                device.ip_address = ip or device.ip_address
-                device.name = device_info.get('name', '') or device.name
-                device.last_seen_at = now
-                if device_info.get('device_type'):
-                    device.device_type = device_info['device_type']
-                device.save()
+                seen = devices_by_mac.get(mac, {})
+                devices_by_mac[mac] = {**seen, **{k: v for k, v in device_info.items() if v}}
+                continue
+
+            # No MAC, use IP (less reliable)
+            seen = devices_by_ip.get(ip, {})
+            devices_by_ip[ip] = {**seen, **{k: v for k, v in device_info.items() if v}}
+
+        # The log and its device writes land together or not at all
+        with transaction.atomic():
+            scan_log = NetworkScanLog.objects.create(
+                owner=request.user,
+                network_ssid=data.get('network_ssid', ''),
+                network_bssid=data.get('network_bssid', ''),
+                json_payload={'devices': devices_data},
+                device_count=len(devices_data),
+            )
+            self._upsert_devices_by_mac(request.user, devices_by_mac, now)
+            self._sync_devices_by_ip(request.user, devices_by_ip, now)
 
         return Response(
             NetworkScanLogSerializer(scan_log).data,
             status=status.HTTP_201_CREATED
         )
 
+    @staticmethod
+    def _upsert_devices_by_mac(owner, devices_by_mac, now):
+        """
+        Insert new devices and refresh existing ones keyed by (owner, mac_address).
+
+        Blank fields in a scan must not overwrite stored values, so devices are
+        grouped by which fields they carry and each group is upserted with
+        only those columns updated on conflict.
+        """
+        groups = defaultdict(list)
+        for mac, device_info in devices_by_mac.items():
+            ip = device_info.get('ip_address', '')
+            name = device_info.get('name', '')
+            device_type = device_info.get('device_type', '')
+
+            update_fields = ['last_seen_at']
+            if ip:
+                update_fields.append('ip_address')
+            if name:
+                update_fields.append('name')
+            if device_type:
+                update_fields.append('device_type')
+
+            groups[tuple(update_fields)].append(NetworkDevice(
+                owner=owner,
+                mac_address=mac,
+                ip_address=ip or '0.0.0.0',
+                name=name,
+                device_type=device_type or NetworkDevice.DeviceType.UNKNOWN,
+                first_seen_at=now,
+                last_seen_at=now,
+            ))
+
+        for update_fields, devices in groups.items():
+            NetworkDevice.objects.bulk_create(
+                devices,
+                update_conflicts=True,
+                unique_fields=['owner', 'mac_address'],
+                update_fields=list(update_fields),
+            )
+
+    @staticmethod
+    def _sync_devices_by_ip(owner, devices_by_ip, now):
+        """
+        Insert new and refresh existing MAC-less devices keyed by IP address.
+
+        Known devices are fetched in one query and written back with a
+        batched UPDATE instead of a save() per device.
+        """
+        if not devices_by_ip:
+            return
+
+        existing = {
+            device.ip_address: device
+            for device in NetworkDevice.objects.filter(
+                owner=owner, mac_address='', ip_address__in=list(devices_by_ip)
+            )
+        }
+
+        to_create = []
+        to_update = []
+        for ip, device_info in devices_by_ip.items():
+            device = existing.get(ip)
+            if device is None:
+                to_create.append(NetworkDevice(
+                    owner=owner,
+                    ip_address=ip,
+                    mac_address='',
+                    name=device_info.get('name', ''),
+                    device_type=device_info.get('device_type') or NetworkDevice.DeviceType.UNKNOWN,
+                    first_seen_at=now,
+                    last_seen_at=now,
+                ))
+                continue
+
+            device.name = device_info.get('name') or device.name
+            device.device_type = device_info.get('device_type') or device.device_type
+            device.last_seen_at = now
+            to_update.append(device)
+
+        if to_create:
+            NetworkDevice.objects.bulk_create(to_create)
+        if to_update:
+            NetworkDevice.objects.bulk_update(
+                to_update, ['name', 'device_type', 'last_seen_at'], batch_size=500
+            )
+
 
 # =============================================================================
 # Privacy Check Views
 # =============================================================================
 
+def _build_privacy_check(user, data):
+    """Score one validated privacy check request into an unsaved PrivacyCheck."""
+    network_usage_level = data.get(
+        'network_usage_level', PrivacyCheck.NetworkUsageLevel.MEDIUM
+    )
+
+    # Calculate privacy score
+    score, explanation, suggested_action = calculate_privacy_score(
+        permissions=data.get('permissions', []),
+        category=data.get('category', ''),
+        network_usage_level=network_usage_level.name,
+    )
+
+    return PrivacyCheck(
+        user=user,
+        app_package_name=data['package_name'],
+        app_name=data['app_name'],
+        permissions=data.get('permissions', []),
+        network_usage_level=network_usage_level,
+        calculated_privacy_score=score,
+        explanation=explanation,
+        suggested_action=suggested_action,
+    )
+
+
 class PrivacyCheckView(APIView):
     """
     POST /api/privacy/check/
@@ -254,47 +398,52 @@ class PrivacyCheckView(APIView):
         serializer = PrivacyCheckRequestSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        data = serializer.validated_data
+        privacy_check = _build_privacy_check(request.user, serializer.validated_data)
+        privacy_check.save()
 
-        # Calculate privacy score
-        score, explanation, suggested_action = calculate_privacy_score(
-            permissions=data.get('permissions', []),
-            category=data.get('category', ''),
-            network_usage_level=data.get('network_usage_level', 'MEDIUM'),
+        return Response(
+            PrivacyCheckSerializer(privacy_check).data,
+            status=status.HTTP_201_CREATED
         )
 
-        # Save the check
-        privacy_check = PrivacyCheck.objects.create(
-            user=request.user,
-            app_package_name=data['package_name'],
-            app_name=data['app_name'],
-            permissions=data.get('permissions', []),
-            network_usage_level=data.get('network_usage_level', 'MEDIUM'),
-            calculated_privacy_score=score,
-            explanation=explanation,
-            suggested_action=suggested_action,
-        )
+
+class PrivacyCheckBatchView(APIView):
+    """
+    POST /api/privacy/checks/batch/
+    Perform privacy checks on several apps, saved in one transaction.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request):
+        serializer = PrivacyCheckBatchRequestSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        privacy_checks = [
+            _build_privacy_check(request.user, data)
+            for data in serializer.validated_data['apps']
+        ]
+        PrivacyCheck.objects.bulk_create(privacy_checks)
 
         return Response(
-            PrivacyCheckSerializer(privacy_check).data,
+            PrivacyCheckSerializer(privacy_checks, many=True).data,
             status=status.HTTP_201_CREATED
         )
 
 
-class PrivacyCheckListView(APIView):
+class PrivacyCheckListView(generics.ListAPIView):
     """
     GET /api/privacy/checks/
-    List all privacy checks for the current user.
+    List the current user's privacy checks, one page at a time.
     """
+    serializer_class = PrivacyCheckSerializer
     permission_classes = [IsAuthenticated]
 
-    def get(self, request):
-        checks = PrivacyCheck.objects.filter(user=request.user)
+    def get_queryset(self):
+        checks = PrivacyCheck.objects.filter(user=self.request.user)
 
         # Optional filter by package name
-        package_name = request.query_params.get('package_name')
+        package_name = self.request.query_params.get('package_name')
         if package_name:
             checks = checks.filter(app_package_name=package_name)
 
-        serializer = PrivacyCheckSerializer(checks, many=True)
-        return Response(serializer.data)
+        return checks
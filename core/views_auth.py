@@ -2,7 +2,14 @@
 Authentication Views for Antygravity Backend.
 """
 
+import hashlib
+import hmac
+
+from django.conf import settings
 from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth.hashers import make_password
+from django.core.cache import cache
+from django.db import transaction
 from rest_framework import status, generics
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -13,8 +20,9 @@ from .serializers import (
     RegisterSerializer,
     LoginSerializer,
     SocialLoginSerializer,
-    UserSerializer,
     UserUpdateSerializer,
+    USER_PAYLOAD_FIELDS,
+    serialize_user,
 )
 from .models import SocialAccount
 from .services.social_auth import verify_google_token, verify_apple_token, SocialAuthError
@@ -31,6 +39,105 @@ def get_tokens_for_user(user):
     }
 
 
+def auth_response(request, user, status_code=status.HTTP_200_OK):
+    """
+    Build the token response for a login or registration.
+
+    Clients that only need fresh tokens pass ?tokens_only=1 to skip the user payload.
+    """
+    tokens = get_tokens_for_user(user)
+    if request.query_params.get('tokens_only', '').lower() in ('1', 'true'):
+        return Response({'tokens': tokens}, status=status_code)
+
+    return Response({
+        'user': serialize_user(user),
+        'tokens': tokens,
+    }, status=status_code)
+
+
+# Repeat logins with the same credentials inside this window skip password hashing
+LOGIN_CACHE_TIMEOUT = 5
+
+
+def _login_cache_key(email, password):
+    # Keyed by an HMAC so the cache never holds anything derived from the password alone
+    digest = hmac.new(
+        settings.SECRET_KEY.encode(), f'{email}:{password}'.encode(), hashlib.sha256
+    ).hexdigest()
+    return f'login:{digest}'
+
+
+def _password_fingerprint(user):
+    return hashlib.sha256(user.password.encode()).hexdigest()
+
+
+def remember_authenticated_user(email, password, user):
+    """Record a successful password check for LOGIN_CACHE_TIMEOUT seconds."""
+    cache.set(
+        _login_cache_key(email, password),
+        (user.pk, _password_fingerprint(user)),
+        LOGIN_CACHE_TIMEOUT
+    )
+
+
+def get_recently_authenticated_user(email, password):
+    """
+    Return the active user these credentials just authenticated, or None.
+
+    The stored password fingerprint must still match, so a password change
+    invalidates the entry immediately.
+    """
+    cached = cache.get(_login_cache_key(email, password))
+    if cached is None:
+        return None
+
+    user_id, fingerprint = cached
+    user = User.objects.filter(pk=user_id, is_active=True).first()
+    if user is None or _password_fingerprint(user) != fingerprint:
+        return None
+    return user
+
+
+def get_social_user(provider, provider_user_id, email, **extra_fields):
+    """
+    Return the user linked to a social account.
+
+    On first login the account is linked to the user with the same email,
+    or to a new user created with extra_fields.
+    """
+    social_account = SocialAccount.objects.select_related('user').only(
+        'user', *(f'user__{field}' for field in USER_PAYLOAD_FIELDS)
+    ).filter(
+        provider=provider,
+        provider_user_id=provider_user_id
+    ).first()
+    if social_account is not None:
+        return social_account.user
+
+    # A new user and its link are committed together
+    with transaction.atomic():
+        # Check if user with this email exists
+        if email:
+            # get_or_create also recovers if a concurrent login inserts this email first
+            user, _ = User.objects.only(*USER_PAYLOAD_FIELDS).get_or_create(
+                email=User.objects.normalize_email(email),
+                defaults={'password': make_password(None), **extra_fields},
+            )
+        else:
+            # No email provided, create with the provider's user ID as identifier
+            fake_email = f"{provider_user_id}@{provider.lower()}.antygravity.local"
+            user = User.objects.create_user(email=fake_email, **extra_fields)
+
+        # Create social account link
+        SocialAccount.objects.create(
+            user=user,
+            provider=provider,
+            provider_user_id=provider_user_id,
+            email=email,
+        )
+    return user
+
+
 class RegisterView(generics.CreateAPIView):
     """
     POST /api/auth/register/
@@ -44,13 +151,12 @@ class RegisterView(generics.CreateAPIView):
         serializer.is_valid(raise_exception=True)
         user = serializer.save()
 
-        tokens = get_tokens_for_user(user)
-        user_data = UserSerializer(user).data
+        return auth_response(request, user, status.HTTP_201_CREATED)
+
 
-        return Response({
-            'user': user_data,
-            'tokens': tokens,
-        }, status=status.HTTP_201_CREATED)
+# Shared 401 bodies; the renderer only reads them
+INVALID_CREDENTIALS_BODY = {'detail': 'Invalid email or password.'}
+ACCOUNT_DISABLED_BODY = {'detail': 'User account is disabled.'}
 
 
 class LoginView(APIView):
@@ -64,30 +170,31 @@ class LoginView(APIView):
         serializer = LoginSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        email = serializer.validated_data['email']
-        password = serializer.validated_data['password']
+        data = serializer.validated_data
 
-        user = authenticate(request, username=email, password=password)
+        # Stored emails are normalized by UserManager; match that form
+        email = User.objects.normalize_email(data['email'])
+        password = data['password']
+
+        user = get_recently_authenticated_user(email, password)
+        if user is None:
+            user = authenticate(request, username=email, password=password)
+            if user is not None:
+                remember_authenticated_user(email, password, user)
 
         if user is None:
             return Response(
-                {'detail': 'Invalid email or password.'},
+                INVALID_CREDENTIALS_BODY,
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
         if not user.is_active:
             return Response(
-                {'detail': 'User account is disabled.'},
+                ACCOUNT_DISABLED_BODY,
                 status=status.HTTP_401_UNAUTHORIZED
             )
 
-        tokens = get_tokens_for_user(user)
-        user_data = UserSerializer(user).data
-
-        return Response({
-            'user': user_data,
-            'tokens': tokens,
-        })
+        return auth_response(request, user)
 
 
 class SocialLoginGoogleView(APIView):
@@ -111,50 +218,15 @@ class SocialLoginGoogleView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Check if social account exists
-        try:
-            social_account = SocialAccount.objects.get(
-                provider=SocialAccount.Provider.GOOGLE,
-                provider_user_id=google_data['sub']
-            )
-            user = social_account.user
-        except SocialAccount.DoesNotExist:
-            # Check if user with this email exists
-            email = google_data.get('email', '')
-            if email:
-                try:
-                    user = User.objects.get(email=email)
-                except User.DoesNotExist:
-                    # Create new user
-                    user = User.objects.create_user(
-                        email=email,
-                        full_name=google_data.get('name', ''),
-                        avatar_url=google_data.get('picture', ''),
-                    )
-            else:
-                # No email provided, create with Google sub as identifier
-                fake_email = f"{google_data['sub']}@google.antygravity.local"
-                user = User.objects.create_user(
-                    email=fake_email,
-                    full_name=google_data.get('name', ''),
-                    avatar_url=google_data.get('picture', ''),
-                )
-
-            # Create social account link
-            SocialAccount.objects.create(
-                user=user,
-                provider=SocialAccount.Provider.GOOGLE,
-                provider_user_id=google_data['sub'],
-                email=email,
-            )
-
-        tokens = get_tokens_for_user(user)
-        user_data = UserSerializer(user).data
+        user = get_social_user(
+            SocialAccount.Provider.GOOGLE,
+            google_data['sub'],
+            google_data.get('email', ''),
+            full_name=google_data.get('name', ''),
+            avatar_url=google_data.get('picture', ''),
+        )
 
-        return Response({
-            'user': user_data,
-            'tokens': tokens,
-        })
+        return auth_response(request, user)
 
 
 class SocialLoginAppleView(APIView):
@@ -178,44 +250,14 @@ class SocialLoginAppleView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Check if social account exists
-        try:
-            social_account = SocialAccount.objects.get(
-                provider=SocialAccount.Provider.APPLE,
-                provider_user_id=apple_data['sub']
-            )
-            user = social_account.user
-        except SocialAccount.DoesNotExist:
-            # Check if user with this email exists
-            email = apple_data.get('email', '')
-            if email:
-                try:
-                    user = User.objects.get(email=email)
-                except User.DoesNotExist:
-                    user = User.objects.create_user(
-                        email=email,
-                        full_name='',  # Apple doesn't always provide name
-                    )
-            else:
-                # No email provided, create with Apple sub as identifier
-                fake_email = f"{apple_data['sub']}@apple.antygravity.local"
-                user = User.objects.create_user(email=fake_email)
-
-            # Create social account link
-            SocialAccount.objects.create(
-                user=user,
-                provider=SocialAccount.Provider.APPLE,
-                provider_user_id=apple_data['sub'],
-                email=email,
-            )
-
-        tokens = get_tokens_for_user(user)
-        user_data = UserSerializer(user).data
+        # Apple doesn't always provide a name
+        user = get_social_user(
+            SocialAccount.Provider.APPLE,
+            apple_data['sub'],
+            apple_data.get('email', ''),
+        )
 
-        return Response({
-            'user': user_data,
-            'tokens': tokens,
-        })
+        return auth_response(request, user)
 
 
 class MeView(APIView):
@@ -227,8 +269,7 @@ class MeView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+        return Response(serialize_user(request.user))
 
     def patch(self, request):
         serializer = UserUpdateSerializer(
@@ -239,4 +280,4 @@ class MeView(APIView):
         serializer.is_valid(raise_exception=True)
         serializer.save()
 
-        return Response(UserSerializer(request.user).data)
+        return Response(serialize_user(request.user))